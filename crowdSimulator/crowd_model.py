@@ -5,7 +5,9 @@ from agent import *
 
 class CrowdModel(mesa.Model):
 
-    def __init__(self, config_file_path, scenario):
+    def __init__(self, config_file_path, scenario, *, seed=None):
+        # mesa.Model.__new__ tworzy self.random z argumentu seed przekazanego do CrowdModel(...),
+        # dlatego seed musi być podawany jako argument nazwany
         super().__init__()
 
         with open(config_file_path, 'r') as f:
@@ -157,3 +159,12 @@ class CrowdModel(mesa.Model):
 
         total_collisions = sum(self.collision_count.values())
         self.collision_history.append(total_collisions)
+
+    def collect_metrics(self):
+        return {
+            "visited_counts": [[x, y, count] for (x, y), count in self.visited_counts.items()],
+            "collision_history": self.collision_history,
+            "intruders_history": self.intruders_history,
+            "grid_width": self.grid.width,
+            "grid_height": self.grid.height,
+        }
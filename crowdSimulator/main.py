@@ -1,9 +1,15 @@
+import argparse
+
 from model_visualization import SimulationVisualization
 ''
 
 def main():
 
-    visualization = SimulationVisualization()
+    parser = argparse.ArgumentParser(description="Crowd Simulation")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    visualization = SimulationVisualization(args.seed)
     visualization.run()
 
 
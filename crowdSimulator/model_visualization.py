@@ -4,13 +4,19 @@ import pygame
 import random
 from param_choice import ParamsChoice
 from crowd_model import CrowdModel
+from run_cache import RunCache
 from statistics import *
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 import io
 
 class SimulationVisualization:
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.run_cache = RunCache()
         self.model = None
         self.grid_size = 20
         self.cell_size = 500 // self.grid_size
@@ -99,10 +105,24 @@ class SimulationVisualization:
 
     def run_scenario(self, scenario):
         running = True
+        completed = False
 
-        params = ParamsChoice()
+        # Ziarno modelu pochodzi z tego samego generatora co parametry losowe,
+        # więc oba korzystają z jednego strumienia zamiast dwóch identycznych
+        model_seed = self.random.getrandbits(64)
+        params = ParamsChoice(self.random)
         directory = f"presets/{params.menu()}"
-        self.model = CrowdModel(directory, scenario)
+        print(f"Seed: {self.seed}")
+
+        cache_key = self.run_cache.make_key(directory, scenario, model_seed)
+        metrics = self.run_cache.get(cache_key)
+        if metrics is not None:
+            self.screen = pygame.display.set_mode((500, 500))
+            self.show_statistics_in_pygame(metrics)
+            pygame.quit()
+            return
+
+        self.model = CrowdModel(directory, scenario, seed=model_seed)
         self.screen = pygame.display.set_mode((500, 500))
         pygame.display.flip()
 
@@ -126,25 +146,30 @@ class SimulationVisualization:
 
 
             # Ważne, procentowo szansa na zrespienie agenta z każdym tickiem
-            if random.randint(1, 20) >= 17:
+            if self.model.random.randint(1, 20) >= 17:
                 self.model.spawn_agent()
 
             if all(not agent.has_moved for agent in self.model.schedule.agents):
                 for agent in self.model.schedule.agents:
                     print(agent.reached_destination)
                 running = False
+                completed = True
 
-        self.show_statistics_in_pygame()
+        metrics = self.model.collect_metrics()
+        # Do cache trafiają tylko pełne przebiegi, nie te przerwane zamknięciem okna
+        if completed:
+            self.run_cache.put(cache_key, metrics)
+        self.show_statistics_in_pygame(metrics)
 
         pygame.quit()
 
-    def show_statistics_in_pygame(self):
+    def show_statistics_in_pygame(self, metrics):
         stats = Statistics()
 
-        fig1 = stats.plot_space_frequency(self.model.visited_counts, self.model.grid.width,
-                                                     self.model.grid.height)
-        fig2 = stats.plot_collision_history(self.model.collision_history)
-        fig3 = stats.plot_intruders_by_zone(self.model.intruders_history)
+        visited_counts = {(x, y): count for x, y, count in metrics["visited_counts"]}
+        fig1 = stats.plot_space_frequency(visited_counts, metrics["grid_width"], metrics["grid_height"])
+        fig2 = stats.plot_collision_history(metrics["collision_history"])
+        fig3 = stats.plot_intruders_by_zone(metrics["intruders_history"])
         self.add_plot(fig1)
         self.add_plot(fig2)
         self.add_plot(fig3)
@@ -5,7 +5,8 @@ import random
 
 
 class ParamsChoice:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.random = rng or random.Random()
         self.screen = pygame.display.set_mode((600, 400))
         pygame.display.set_caption("Select Simulation Parameters")
         self.clock = pygame.time.Clock()
@@ -33,9 +34,9 @@ class ParamsChoice:
 
     def create_random_params(self):
         params = {
-            "num_agents": random.randint(5, 20),
-            "num_objectives": random.randint(1, 5),
-            "num_obstacles": random.randint(30, 50),
+            "num_agents": self.random.randint(5, 20),
+            "num_objectives": self.random.randint(1, 5),
+            "num_obstacles": self.random.randint(30, 50),
             "randomize_objectives": True,
             "randomize_obstacles": True,
             "grid_width": 20,
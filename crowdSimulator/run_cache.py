@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import mesa
+
+
+STALE_TMP_AGE = 60 * 60
+
+
+def code_version():
+    # Wersja obejmuje wszystkie moduły symulatora (poza samym cache) oraz wersję Mesy,
+    # bo harmonogram, siatka i generator losowy Mesy również wpływają na wyniki
+    digest = hashlib.sha256()
+    digest.update(mesa.__version__.encode())
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.endswith(".py") or filename == "run_cache.py":
+            continue
+        with open(os.path.join(source_dir, filename), 'rb') as f:
+            digest.update(filename.encode())
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class RunCache:
+
+    def __init__(self, cache_dir='.run_cache', max_size_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.version = code_version()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, config_file_path, scenario, seed):
+        with open(config_file_path, 'rb') as f:
+            preset_content = f.read()
+
+        digest = hashlib.sha256()
+        digest.update(preset_content)
+        digest.update(json.dumps([scenario, seed, self.version]).encode())
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        path = self.entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                metrics = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Odczyt odświeża czas dostępu, na którym opiera się usuwanie LRU
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return metrics
+
+    def put(self, key, metrics):
+        path = self.entry_path(key)
+        tmp_file = tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False)
+        tmp_path = tmp_file.name
+        try:
+            with tmp_file as f:
+                json.dump(metrics, f)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        now = time.time()
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith((".json", ".tmp")):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            # Inny proces mógł już usunąć ten plik
+            try:
+                stat = os.stat(path)
+                # Stare pliki .tmp to pozostałości po przerwanym zapisie, świeże może jeszcze pisać inny proces
+                if filename.endswith(".tmp"):
+                    if now - stat.st_mtime > STALE_TMP_AGE:
+                        os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size